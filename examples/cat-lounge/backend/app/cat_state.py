@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import logging
 from dataclasses import dataclass, field, replace
 from datetime import datetime
 from random import choice
 from typing import Any
 
+logger = logging.getLogger(__name__)
+
 STATUS_MIN = 0
 STATUS_MAX = 10
 COLOR_PATTERNS = ("black", "calico", "colorpoint", "tabby", "white")
@@ -62,13 +65,13 @@ class CatState:
         self.touch()
 
     def rename(self, value: str) -> None:
-        print(f"Renaming cat to {value}")
+        logger.debug("Renaming cat to %s", value)
         self.name = value
         if not self.color_pattern:
-            print(f"Choosing random color pattern for {value}")
+            logger.debug("Choosing random color pattern for %s", value)
             self.color_pattern = choice(COLOR_PATTERNS)
             self.description = DESCRIPTIONS[self.color_pattern]
-            print(f"Color pattern: {self.color_pattern}")
+            logger.debug("Color pattern: %s", self.color_pattern)
         self.touch()
 
     def set_age(self, value: int | None) -> None:
@@ -96,7 +96,7 @@ class CatAssistantServer(ChatKitServer[dict[str, Any]]):
         )
 
         # Runner expects the most recent message to be last.
-        items = list(reversed(items_page.data))
+        items = items_page.data[::-1]
 
         # Translate ChatKit thread items into agent input.
         input_items = await self.thread_item_converter.to_agent_input(items)
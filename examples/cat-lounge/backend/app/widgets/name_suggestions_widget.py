@@ -5,9 +5,13 @@ This widget wires up two client action configs.
 
 from __future__ import annotations
 
+import logging
+
 from chatkit.widgets import WidgetRoot, WidgetTemplate
 from pydantic import BaseModel, Field
 
+logger = logging.getLogger(__name__)
+
 
 class CatNameSuggestion(BaseModel):
     """Name idea paired with a short blurb describing the cat it fits."""
@@ -31,8 +35,8 @@ def build_name_suggestions_widget(
     selected: str | None = None,
 ) -> WidgetRoot:
     """Render the selectable list widget for cat name suggestions."""
-    print(f"Building name suggestions widget with selected: {selected}")
-    print(f"Names: {names}")
+    logger.debug("Building name suggestions widget with selected: %s", selected)
+    logger.debug("Names: %s", names)
     return name_suggestions_widget_template.build(
         data={
             "items": [suggestion.model_dump() for suggestion in names],
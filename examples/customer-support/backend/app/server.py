@@ -498,7 +498,7 @@ class CustomerSupportServer(ChatKitServer[dict[str, Any]]):
             "desc",
             context,
         )
-        items = list(reversed(items_page.data))
+        items = items_page.data[::-1]
 
         profile_item = _profile_to_input_item(self.agent_state.get_profile(thread.id))
         input_items = [profile_item] + (await self.thread_item_converter.to_agent_input(items))
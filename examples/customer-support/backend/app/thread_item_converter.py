@@ -3,7 +3,7 @@ import logging
 
 from chatkit.agents import ThreadItemConverter
 from chatkit.types import Attachment, HiddenContextItem
-from openai.types.responses import ResponseInputImageParam, ResponseInputTextParam
+from openai.types.responses import ResponseInputImageParam
 from openai.types.responses.response_input_item_param import Message
 
 from .attachment_store import LocalAttachmentStore
@@ -42,14 +42,9 @@ class CustomerSupportThreadItemConverter(ThreadItemConverter):
             detail="auto",
         )
 
-    async def hidden_context_to_input(self, item: HiddenContextItem):
-        return Message(
-            type="message",
-            content=[
-                ResponseInputTextParam(
-                    type="input_text",
-                    text=item.content,
-                )
-            ],
-            role="user",
-        )
+    async def hidden_context_to_input(self, item: HiddenContextItem) -> Message:
+        return {
+            "type": "message",
+            "content": [{"type": "input_text", "text": item.content}],
+            "role": "user",
+        }
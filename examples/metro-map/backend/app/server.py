@@ -67,7 +67,7 @@ class MetroMapServer(ChatKitServer[RequestContext]):
             order="desc",
             context=context,
         )
-        items = list(reversed(items_page.data))
+        items = items_page.data[::-1]
 
         input_items = await self.thread_item_converter.to_agent_input(items)
 
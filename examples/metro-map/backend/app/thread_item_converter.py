@@ -16,17 +16,12 @@ class MetroMapThreadItemConverter(ThreadItemConverter):
     def __init__(self, metro_map_store: MetroMapStore):
         self.metro_map_store = metro_map_store
 
-    async def hidden_context_to_input(self, item: HiddenContextItem):
-        return Message(
-            type="message",
-            content=[
-                ResponseInputTextParam(
-                    type="input_text",
-                    text=item.content,
-                )
-            ],
-            role="user",
-        )
+    async def hidden_context_to_input(self, item: HiddenContextItem) -> Message:
+        return {
+            "type": "message",
+            "content": [{"type": "input_text", "text": item.content}],
+            "role": "user",
+        }
 
     async def tag_to_message_content(self, tag: UserMessageTagContent) -> ResponseInputTextParam:
         """Represent a tagged station with all inline details for the model."""
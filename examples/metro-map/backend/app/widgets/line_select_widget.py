@@ -4,16 +4,22 @@ List widget for picking one of the metro lines.
 
 from __future__ import annotations
 
+from functools import cache
+
 from chatkit.widgets import WidgetRoot, WidgetTemplate
 
 from ..data.metro_map_store import Line
 
-line_select_widget_template = WidgetTemplate.from_file("line_select.widget")
+
+@cache
+def _line_select_widget_template() -> WidgetTemplate:
+    """Load and compile line_select.widget on first use rather than at import."""
+    return WidgetTemplate.from_file("line_select.widget")
 
 
 def build_line_select_widget(lines: list[Line], selected: str | None = None) -> WidgetRoot:
     """Render a line selector widget from the provided line metadata."""
-    return line_select_widget_template.build(
+    return _line_select_widget_template().build(
         data={
             "items": lines,
             "selected": selected,
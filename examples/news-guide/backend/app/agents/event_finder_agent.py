@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import textwrap
 from datetime import datetime
 from typing import Annotated, Any, List
 
@@ -22,7 +23,8 @@ from ..widgets.event_list_widget import build_event_list_widget
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-INSTRUCTIONS = """
+INSTRUCTIONS = textwrap.dedent(
+    """
     You help Foxhollow residents discover local happenings. When a reader asks for events,
     search the curated calendar, call out dates and notable details, and keep recommendations brief.
 
@@ -43,6 +45,7 @@ INSTRUCTIONS = """
     When the user explicitly asks for more details on the events, you MUST describe the events in natural language
     without using the `show_event_list_widget` tool.
 """
+).strip()
 
 MODEL = "gpt-4.1-mini"
 
@@ -68,7 +71,7 @@ async def search_events_by_date(
         raise ValueError("Provide a valid date in YYYY-MM-DD format.")
     await ctx.context.stream(ProgressUpdateEvent(text=f"Looking up events on {date}"))
     records = ctx.context.events.search_by_date(date)
-    return {"events": _events_to_json(records)}
+    return {"events": ctx.context.events.dump_events(records)}
 
 
 @function_tool(description_override="List events occurring on a given day of the week.")
@@ -81,7 +84,7 @@ async def search_events_by_day_of_week(
         raise ValueError("Provide a day of the week to search for (e.g., Saturday).")
     await ctx.context.stream(ProgressUpdateEvent(text=f"Checking {day} events"))
     records = ctx.context.events.search_by_day_of_week(day)
-    return {"events": _events_to_json(records)}
+    return {"events": ctx.context.events.dump_events(records)}
 
 
 @function_tool(
@@ -92,13 +95,13 @@ async def search_events_by_keyword(
     keywords: List[str],
 ) -> dict[str, Any]:
     logger.info("[TOOL CALL] search_events_by_keyword: %s", keywords)
-    tokens = [keyword.strip() for keyword in keywords if keyword and keyword.strip()]
+    tokens = list(filter(None, map(str.strip, keywords)))
     if not tokens:
         raise ValueError("Provide at least one keyword to search for.")
     label = ", ".join(tokens)
     await ctx.context.stream(ProgressUpdateEvent(text=f"Searching for: {label}"))
     records = ctx.context.events.search_by_keyword(tokens)
-    return {"events": _events_to_json(records)}
+    return {"events": ctx.context.events.dump_events(records)}
 
 
 @function_tool(description_override="List all unique event keywords and categories.")
@@ -138,9 +141,9 @@ async def show_event_list_widget(
     try:
         widget = build_event_list_widget(records)
     except Exception as exc:
-        logger.error(f"[ERROR] build_event_list_widget: {exc}")
+        logger.error("[ERROR] build_event_list_widget: %s", exc)
         raise
-    copy_text = ", ".join(filter(None, (event.title for event in records)))
+    copy_text = ", ".join(event.title for event in records if event.title)
     await ctx.context.stream_widget(widget, copy_text=copy_text or "Local events")
 
     summary = message or "Here are the events that match your request."
@@ -156,11 +159,6 @@ async def show_event_list_widget(
     )
 
 
-def _events_to_json(events: List[EventRecord]) -> List[dict[str, Any]]:
-    """Convert EventRecord models to JSON-safe dicts for tool responses."""
-    return [event.model_dump(mode="json", by_alias=True) for event in events]
-
-
 class EventSummaryContext(AgentContext):
     model_config = ConfigDict(arbitrary_types_allowed=True)
     store: Annotated[MemoryStore, Field(exclude=True)]
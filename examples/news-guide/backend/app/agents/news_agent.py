@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import textwrap
 from datetime import datetime
 from typing import Annotated, List
 
@@ -22,7 +23,8 @@ from ..widgets.article_list_widget import build_article_list_widget
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-INSTRUCTIONS = """
+INSTRUCTIONS = textwrap.dedent(
+    """
     You are News Guide, a service-forward assistant focused on helping readers quickly
     discover the most relevant news for their needs. Prioritize clarity, highlight how
     each story serves the reader, and keep answers concise with skimmable structure.
@@ -75,6 +77,7 @@ INSTRUCTIONS = """
 
     Suggest a next step—such as related articles or follow-up angles—whenever it adds value.
 """
+).strip()
 
 MODEL = "gpt-4.1-mini"
 FEATURED_PAGE_ID = "featured"
@@ -128,11 +131,11 @@ async def search_articles_by_tags(
     logger.info("[TOOL CALL] search_articles_by_tags %s", tags)
     if not tags:
         raise ValueError("Please provide at least one tag to search for.")
-    tags = [tag.strip().lower() for tag in tags if tag and tag.strip()]
+    tags = _clean_terms(tags)
     tag_label = ", ".join(tags)
     await ctx.context.stream(ProgressUpdateEvent(text=f"Searching for tags: {tag_label}"))
     records = ctx.context.articles.list_metadata_for_tags(tags)
-    articles = [ArticleMetadata.model_validate(record) for record in records]
+    articles = [ArticleMetadata.from_store(record) for record in records]
     return ArticleSearchResult(articles=articles)
 
 
@@ -153,7 +156,7 @@ async def search_articles_by_author(
     display_name = " ".join(author.split("-")).title()
     await ctx.context.stream(ProgressUpdateEvent(text=f"Looking for articles by {display_name}..."))
     records = ctx.context.articles.search_metadata_by_author(author)
-    articles = [ArticleMetadata.model_validate(record) for record in records]
+    articles = [ArticleMetadata.from_store(record) for record in records]
     return AuthorSearchResult(author=author, articles=articles)
 
 
@@ -180,14 +183,14 @@ async def search_articles_by_keywords(
     ctx: RunContextWrapper[NewsAgentContext],
     keywords: List[str],
 ) -> ArticleSearchResult:
-    cleaned = [keyword.strip().lower() for keyword in keywords if keyword and keyword.strip()]
+    cleaned = _clean_terms(keywords)
     logger.info("[TOOL CALL] search_articles_by_keywords %s", cleaned)
     if not cleaned:
         raise ValueError("Please provide at least one non-empty keyword to search for.")
     formatted = ", ".join(cleaned)
     await ctx.context.stream(ProgressUpdateEvent(text=f"Searching for keywords: {formatted}"))
     records = ctx.context.articles.search_metadata_by_keywords(cleaned)
-    articles = [ArticleMetadata.model_validate(record) for record in records]
+    articles = [ArticleMetadata.from_store(record) for record in records]
     return ArticleSearchResult(articles=articles)
 
 
@@ -207,7 +210,7 @@ async def search_articles_by_exact_text(
         raise ValueError("Please provide a non-empty text string to search for.")
     await ctx.context.stream(ProgressUpdateEvent(text=f"Scanning articles for: {trimmed}"))
     records = ctx.context.articles.search_content_by_exact_text(trimmed)
-    articles = [ArticleMetadata.model_validate(record) for record in records]
+    articles = [ArticleMetadata.from_store(record) for record in records]
     return ArticleSearchResult(articles=articles)
 
 
@@ -226,7 +229,7 @@ async def get_article_by_id(
     record = ctx.context.articles.get_article(article_id)
     if not record:
         raise ValueError(f"Article '{article_id}' does not exist.")
-    article = ArticleRecord.model_validate(record)
+    article = ArticleRecord.from_store(record)
     return ArticleRecordResult(article=article)
 
 
@@ -280,8 +283,7 @@ async def show_article_list_widget(
             )
         )
 
-        widget = build_article_list_widget(articles)
-        titles = ", ".join(article.title for article in articles)
+        widget, titles = build_article_list_widget(articles)
         await ctx.context.stream_widget(widget, copy_text=titles)
     except Exception as exc:
         logger.error("[ERROR] show_article_list_widget: %s", exc)
@@ -291,22 +293,31 @@ async def show_article_list_widget(
 # -- Helper functions -------------------------------------------------------
 
 
-def _load_featured_articles(store: ArticleStore) -> list[ArticleRecord]:
-    metadata_entries = store.list_metadata_for_tags([FEATURED_PAGE_ID])
-    articles: list[ArticleRecord] = []
-    seen: set[str] = set()
+def _clean_terms(values: List[str]) -> list[str]:
+    """Strip and lowercase tool-provided terms, dropping blanks."""
+    return list(map(str.lower, filter(None, map(str.strip, values))))
+
 
-    for entry in metadata_entries:
-        article_id = entry.id
-        if not article_id or article_id in seen:
-            continue
+# Featured page records, keyed by the store and the generation they were loaded from.
+_featured_cache: tuple[ArticleStore, int, list[ArticleRecord]] | None = None
 
-        record = store.get_article(article_id)
-        if record:
-            articles.append(ArticleRecord.model_validate(record))
-            seen.add(article_id)
 
-    return articles
+def _load_featured_articles(store: ArticleStore) -> list[ArticleRecord]:
+    global _featured_cache
+    generation = store.generation
+    if (
+        _featured_cache is not None
+        and _featured_cache[0] is store
+        and _featured_cache[1] == generation
+    ):
+        return list(_featured_cache[2])
+
+    metadata_entries = store.list_metadata_for_tags([FEATURED_PAGE_ID])
+    article_ids = dict.fromkeys(entry.id for entry in metadata_entries if entry.id)
+    records = store.get_articles_bulk(article_ids)
+    articles = [ArticleRecord.from_store(record) for record in records.values()]
+    _featured_cache = (store, generation, articles)
+    return list(articles)
 
 
 def _load_current_page_records(
@@ -321,7 +332,7 @@ def _load_current_page_records(
     record = store.get_article(article_id)
     if not record:
         raise ValueError(f"Article '{article_id}' does not exist.")
-    return "article", [ArticleRecord.model_validate(record)]
+    return "article", [ArticleRecord.from_store(record)]
 
 
 # -- Agent definition -------------------------------------------------------
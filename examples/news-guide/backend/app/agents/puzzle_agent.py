@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import textwrap
+
 from agents import Agent
 from chatkit.agents import AgentContext
 from pydantic import ConfigDict
 
-INSTRUCTIONS = """
+INSTRUCTIONS = textwrap.dedent(
+    """
     You host Foxhollow's Coffee Break Puzzle Corner — a cheerful diversion for readers steeped
     in cozy small-town life, orchard breezes, lavender-scented crosswalk buttons, and farmers
     market gossip. The community loves playful intellect with local color, from Depot Hall night
@@ -36,6 +39,7 @@ INSTRUCTIONS = """
     Throughout both puzzles, sprinkle in sensory details about Foxhollow (cider tastings, lantern
     walks, greenhouse seed swaps) so the games feel rooted in the community lore.
 """
+).strip()
 
 MODEL = "gpt-4.1-mini"
 
@@ -4,20 +4,24 @@ Data models and store for News Guide demo articles.
 
 from __future__ import annotations
 
-import json
 import re
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, Iterable, List, Mapping, Self
 
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+
+_WORD_SPLIT = re.compile(r"[^a-z0-9]+")
 
 
 def slugify(value: str) -> str:
     """
     Lightweight slugification for matching ids in a predictable, URL-friendly way.
     """
-    normalized = re.sub(r"[^a-z0-9]+", "-", value.lower()).strip("-")
+    normalized = _WORD_SPLIT.sub("-", value.lower()).strip("-")
     return normalized
 
 
@@ -35,6 +39,21 @@ class ArticleMetadata(BaseModel):
     tags: List[str] = Field(default_factory=list)
     keywords: List[str] = Field(default_factory=list)
 
+    @classmethod
+    def from_store(cls, record: ArticleMetadata | Mapping[str, Any]) -> Self:
+        """
+        Wrap a record returned by ArticleStore without re-running validation.
+        Store data is validated once at load time, so only the isoformat date needs restoring.
+        """
+        if isinstance(record, cls):
+            return record
+        if isinstance(record, ArticleMetadata):
+            return cls.model_construct(**dict(record))
+        data = dict(record)
+        if isinstance(data.get("date"), str):
+            data["date"] = datetime.fromisoformat(data["date"])
+        return cls.model_construct(**data)
+
 
 class ArticleRecord(ArticleMetadata):
     """Metadata plus markdown content."""
@@ -42,6 +61,44 @@ class ArticleRecord(ArticleMetadata):
     content: str
 
 
+_ARTICLE_METADATA_LIST_ADAPTER: TypeAdapter[List[ArticleMetadata]] = TypeAdapter(
+    List[ArticleMetadata]
+)
+
+# Joins an article's lowercase search fields into one haystack; never appears in the data,
+# so a match can't span two fields.
+_SEARCH_FIELD_SEPARATOR = "\x1f"
+
+# Length of the character n-grams indexed to narrow keyword search candidates.
+_NGRAM_LENGTH = 3
+
+# Upper bound on concurrent markdown reads during reload.
+_MAX_READ_WORKERS = 16
+
+# Separates article bodies in the exact-text corpus; never appears in markdown content.
+_CORPUS_SEPARATOR = "\x00"
+
+
+def _ngrams(text: str) -> set[str]:
+    return {text[i : i + _NGRAM_LENGTH] for i in range(len(text) - _NGRAM_LENGTH + 1)}
+
+
+@lru_cache(maxsize=1024)
+def _expanded_search_terms(keywords: tuple[str, ...]) -> frozenset[str]:
+    """
+    Expand sanitized keywords with their combined phrase and individual word tokens.
+    Cached since agents tend to repeat the same keyword searches across turns.
+    """
+    search_terms: set[str] = set(keywords)
+    combined_phrase = " ".join(keywords).strip()
+    if combined_phrase:
+        search_terms.add(combined_phrase)
+    for term in list(search_terms):
+        search_terms.update(token for token in _WORD_SPLIT.split(term) if token)
+    # Terms containing the separator could never match within a single field.
+    return frozenset(term for term in search_terms if _SEARCH_FIELD_SEPARATOR not in term)
+
+
 class ArticleStore:
     """
     Loads article metadata and markdown bodies from disk.
@@ -52,6 +109,20 @@ class ArticleStore:
         self.data_dir = Path(data_dir)
         self._articles: Dict[str, ArticleRecord] = {}
         self._order: List[str] = []
+        # JSON-ready payloads projected once per reload; handed out as shallow copies.
+        self._article_payloads: Dict[str, Dict[str, Any]] = {}
+        self._metadata_payloads: Dict[str, Dict[str, Any]] = {}
+        self._search_haystacks: List[str] = []
+        # N-gram -> positions in _order of the haystacks containing it.
+        self._ngram_postings: Dict[str, set[int]] = {}
+        # Lowercase tag -> ascending positions in _order of the articles carrying it.
+        self._tag_postings: Dict[str, List[int]] = {}
+        self._authors: List[Dict[str, Any]] = []
+        self._available_tags: List[str] = []
+        self._available_keywords: List[str] = []
+        self._corpus = ""
+        self._corpus_ends: List[int] = []
+        self._generation = 0
         self.reload()
 
     @property
@@ -62,36 +133,95 @@ class ArticleStore:
     def metadata_path(self) -> Path:
         return self.data_dir / "articles.json"
 
+    @property
+    def generation(self) -> int:
+        """Counter bumped on every reload, for callers caching derived payloads."""
+        return self._generation
+
     def reload(self) -> None:
         """Hydrate articles from metadata + markdown files."""
         metadata_entries = self._load_metadata()
         articles: Dict[str, ArticleRecord] = {}
         order: List[str] = []
-
-        for entry in metadata_entries:
-            markdown = self._load_markdown(entry)
+        article_payloads: Dict[str, Dict[str, Any]] = {}
+        metadata_payloads: Dict[str, Dict[str, Any]] = {}
+        search_haystacks: List[str] = []
+        ngram_postings: Dict[str, set[int]] = {}
+        tag_postings: Dict[str, List[int]] = {}
+        authors: Dict[str, Dict[str, Any]] = {}
+
+        for position, (entry, markdown) in enumerate(
+            zip(metadata_entries, self._load_markdown_files(metadata_entries))
+        ):
             record = ArticleRecord(**entry.model_dump(), content=markdown)
             articles[record.id] = record
             order.append(record.id)
 
+            payload = record.model_dump()
+            payload["date"] = record.date.isoformat()
+            article_payloads[record.id] = payload
+            metadata_payloads[record.id] = {
+                key: value for key, value in payload.items() if key != "content"
+            }
+            haystack = self._metadata_search_haystack(record)
+            search_haystacks.append(haystack)
+            for ngram in _ngrams(haystack):
+                ngram_postings.setdefault(ngram, set()).add(position)
+            for tag in dict.fromkeys(tag.lower() for tag in record.tags):
+                tag_postings.setdefault(tag, []).append(position)
+            if record.author:
+                author_slug = slugify(record.author)
+                author = authors.setdefault(
+                    author_slug,
+                    {"id": author_slug, "name": record.author, "articleCount": 0},
+                )
+                author["articleCount"] += 1
+
         self._articles = articles
         self._order = order
-
-    def _load_metadata(self) -> Iterable[ArticleMetadata]:
+        self._article_payloads = article_payloads
+        self._metadata_payloads = metadata_payloads
+        self._search_haystacks = search_haystacks
+        self._ngram_postings = ngram_postings
+        self._tag_postings = tag_postings
+        self._authors = sorted(authors.values(), key=lambda item: item["name"])
+        self._available_tags = sorted(
+            {tag for record in articles.values() for tag in record.tags if tag}
+        )
+        self._available_keywords = sorted(
+            {keyword for record in articles.values() for keyword in record.keywords if keyword}
+        )
+        self._corpus = _CORPUS_SEPARATOR.join(articles[article_id].content for article_id in order)
+        corpus_ends: List[int] = []
+        offset = 0
+        for article_id in order:
+            offset += len(articles[article_id].content)
+            corpus_ends.append(offset)
+            offset += len(_CORPUS_SEPARATOR)
+        self._corpus_ends = corpus_ends
+        self._generation += 1
+
+    def _load_metadata(self) -> List[ArticleMetadata]:
         if not self.metadata_path.exists():
             raise FileNotFoundError(f"Missing article metadata file: {self.metadata_path}")
 
-        with self.metadata_path.open("r", encoding="utf-8") as file:
-            raw = json.load(file)
-
-        if not isinstance(raw, list):
-            raise ValueError("articles.json must contain a list of article entries.")
-
-        for idx, entry in enumerate(raw):
-            try:
-                yield ArticleMetadata.model_validate(entry)
-            except ValidationError as exc:
-                raise ValueError(f"Invalid article metadata at index {idx}: {exc}") from exc
+        try:
+            return _ARTICLE_METADATA_LIST_ADAPTER.validate_json(self.metadata_path.read_bytes())
+        except ValidationError as exc:
+            error = exc.errors()[0]
+            loc = error["loc"]
+            if loc and isinstance(loc[0], int):
+                raise ValueError(f"Invalid article metadata at index {loc[0]}: {exc}") from exc
+            if error["type"] == "list_type":
+                raise ValueError("articles.json must contain a list of article entries.") from exc
+            raise ValueError(f"articles.json is not valid JSON: {exc}") from exc
+
+    def _load_markdown_files(self, entries: List[ArticleMetadata]) -> List[str]:
+        """Read markdown bodies concurrently so per-file I/O latency overlaps."""
+        if not entries:
+            return []
+        with ThreadPoolExecutor(max_workers=min(_MAX_READ_WORKERS, len(entries))) as executor:
+            return list(executor.map(self._load_markdown, entries))
 
     def _load_markdown(self, metadata: ArticleMetadata) -> str:
         markdown_path = self.articles_path / metadata.filename
@@ -120,47 +250,49 @@ class ArticleStore:
         if not normalized:
             return self.list_metadata()
 
-        payload: List[ArticleMetadata] = []
-        for article_id in self._order:
-            record = self._articles[article_id]
-            if not set(record.tags).intersection(normalized):
-                continue
-            payload.append(record)
-
-        return payload
+        positions: set[int] = set()
+        for tag in normalized:
+            positions.update(self._tag_postings.get(tag, ()))
+        return [self._articles[self._order[position]] for position in sorted(positions)]
 
     def get_article(self, article_id: str) -> Dict[str, Any] | None:
-        record = self._articles.get(article_id)
-        if not record:
+        payload = self._article_payloads.get(article_id)
+        if not payload:
             return None
-        payload = record.model_dump()
-        payload["date"] = record.date.isoformat()
-        return payload
+        return dict(payload)
+
+    def get_articles_bulk(self, article_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Return full article payloads keyed by id, in request order, skipping unknown ids.
+        """
+        payloads: Dict[str, Dict[str, Any]] = {}
+        for article_id in article_ids:
+            payload = self._article_payloads.get(article_id)
+            if payload:
+                payloads[article_id] = dict(payload)
+        return payloads
 
     def get_metadata(self, article_id: str) -> Dict[str, Any] | None:
-        record = self._articles.get(article_id)
-        if not record:
+        data = self._metadata_payloads.get(article_id)
+        if not data:
             return None
-        data = record.model_dump(exclude={"content"})
-        data["date"] = record.date.isoformat()
-        return data
+        return dict(data)
+
+    def get_metadata_many(self, article_ids: Iterable[str]) -> List[Dict[str, Any]]:
+        """
+        Return metadata payloads in request order, skipping unknown ids.
+        """
+        return [
+            dict(data)
+            for article_id in article_ids
+            if (data := self._metadata_payloads.get(article_id))
+        ]
 
     def list_authors(self) -> list[dict[str, Any]]:
         """
         Return unique authors with a stable slug and article count, sorted by name.
         """
-        authors: dict[str, dict[str, Any]] = {}
-        for article_id in self._order:
-            record = self._articles[article_id]
-            if not record.author:
-                continue
-            author_slug = slugify(record.author)
-            entry = authors.setdefault(
-                author_slug,
-                {"id": author_slug, "name": record.author, "articleCount": 0},
-            )
-            entry["articleCount"] += 1
-        return sorted(authors.values(), key=lambda item: item["name"])
+        return [dict(author) for author in self._authors]
 
     def tags_index(self) -> Dict[str, List[str]]:
         """Return a map of tag -> ordered article ids containing that tag."""
@@ -178,8 +310,7 @@ class ArticleStore:
         tagged_metadata: Dict[str, List[Dict[str, Any]]] = {}
         for article_id in self._order:
             record = self._articles[article_id]
-            metadata = record.model_dump(exclude={"content"})
-            metadata["date"] = record.date.isoformat()
+            metadata = dict(self._metadata_payloads[article_id])
             for tag in record.tags:
                 tagged_metadata.setdefault(tag.lower(), []).append(metadata)
         return tagged_metadata
@@ -193,46 +324,67 @@ class ArticleStore:
         if not sanitized:
             return []
 
-        search_terms: set[str] = set(sanitized)
-        combined_phrase = " ".join(sanitized).strip()
-        if combined_phrase:
-            search_terms.add(combined_phrase)
-        for term in list(search_terms):
-            tokens = [token for token in re.split(r"[^a-z0-9]+", term) if token]
-            search_terms.update(tokens)
-
+        search_terms = _expanded_search_terms(tuple(sanitized))
+        candidates = self._keyword_candidates(search_terms)
         matches: List[Dict[str, Any]] = []
-        for article_id in self._order:
-            record = self._articles[article_id]
-            metadata_fields = self._metadata_search_fields(record)
-            if any(term in field for term in search_terms for field in metadata_fields):
-                metadata = record.model_dump(exclude={"content"})
-                metadata["date"] = record.date.isoformat()
-                matches.append(metadata)
+        for position in sorted(candidates):
+            haystack = self._search_haystacks[position]
+            if any(term in haystack for term in search_terms):
+                matches.append(dict(self._metadata_payloads[self._order[position]]))
 
         return matches
 
+    def _keyword_candidates(self, search_terms: Iterable[str]) -> set[int] | range:
+        """
+        Narrow keyword search to haystacks containing every n-gram of some term.
+        Terms shorter than an n-gram can't be indexed, so they keep every article in play.
+        """
+        candidates: set[int] = set()
+        for term in search_terms:
+            if len(term) < _NGRAM_LENGTH:
+                return range(len(self._order))
+            candidates.update(self._term_candidates(term))
+        return candidates
+
+    def _term_candidates(self, term: str) -> set[int]:
+        """Return positions whose haystack contains every n-gram of term."""
+        postings: list[set[int]] = []
+        for ngram in _ngrams(term):
+            posting = self._ngram_postings.get(ngram)
+            if posting is None:
+                return set()
+            postings.append(posting)
+
+        # Start from the rarest n-gram and stop as soon as nothing is left.
+        postings.sort(key=len)
+        matched = set(postings[0])
+        for posting in postings[1:]:
+            matched &= posting
+            if not matched:
+                break
+        return matched
+
     def search_content_by_exact_text(self, text: str) -> List[Dict[str, Any]]:
         """
         Return ordered article metadata for records whose markdown content contains text exactly.
         """
         trimmed = text.strip()
-        if not trimmed:
+        if not trimmed or _CORPUS_SEPARATOR in trimmed:
             return []
 
+        # Scan the joined corpus once; after each hit, resume at the next article's body.
         matches: List[Dict[str, Any]] = []
-        for article_id in self._order:
-            record = self._articles[article_id]
-            if trimmed not in record.content:
-                continue
-            metadata = record.model_dump(exclude={"content"})
-            metadata["date"] = record.date.isoformat()
-            matches.append(metadata)
+        position = self._corpus.find(trimmed)
+        while position != -1:
+            index = bisect_right(self._corpus_ends, position)
+            article_id = self._order[index]
+            matches.append(dict(self._metadata_payloads[article_id]))
+            position = self._corpus.find(trimmed, self._corpus_ends[index] + 1)
         return matches
 
-    def _metadata_search_fields(self, record: ArticleRecord) -> List[str]:
+    def _metadata_search_haystack(self, record: ArticleRecord) -> str:
         """
-        Collect lowercase metadata strings for simple keyword search.
+        Join an article's metadata strings into one lowercase haystack for keyword search.
         """
         fields: List[str] = [
             record.id,
@@ -244,21 +396,16 @@ class ArticleStore:
         fields.extend(record.tags)
         fields.extend(record.keywords)
         fields.append(record.date.isoformat())
-        return [field.lower() for field in fields if field]
+        # Lowercasing the joined string leaves the separator intact, so one call covers all fields.
+        return _SEARCH_FIELD_SEPARATOR.join(field for field in fields if field).lower()
 
     def list_available_tags_and_keywords(self) -> Dict[str, List[str]]:
         """
         Return sorted unique tags and keywords present across all articles.
         """
-        tags: set[str] = set()
-        keywords: set[str] = set()
-        for article_id in self._order:
-            record = self._articles[article_id]
-            tags.update(tag for tag in record.tags if tag)
-            keywords.update(keyword for keyword in record.keywords if keyword)
         return {
-            "tags": sorted(tags),
-            "keywords": sorted(keywords),
+            "tags": list(self._available_tags),
+            "keywords": list(self._available_keywords),
         }
 
     def search_metadata_by_author(self, author: str) -> List[Dict[str, Any]]:
@@ -280,8 +427,6 @@ class ArticleStore:
                 or normalized_slug == author_slug
                 or normalized in author_slug
             ):
-                metadata = record.model_dump(exclude={"content"})
-                metadata["date"] = record.date.isoformat()
-                matches.append(metadata)
+                matches.append(dict(self._metadata_payloads[article_id]))
 
         return matches
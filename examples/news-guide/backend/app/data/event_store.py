@@ -4,13 +4,12 @@ Data models and search helpers for News Guide events.
 
 from __future__ import annotations
 
-import json
 import re
 from datetime import date, datetime, time
 from pathlib import Path
-from typing import Dict, Iterable, List, Sequence
+from typing import Any, Dict, Iterable, List, Sequence
 
-from pydantic import BaseModel, ConfigDict, Field, ValidationError
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
 
 
 class EventRecord(BaseModel):
@@ -29,6 +28,15 @@ class EventRecord(BaseModel):
     keywords: List[str] = Field(default_factory=list)
 
 
+_EVENT_LIST_ADAPTER: TypeAdapter[List[EventRecord]] = TypeAdapter(List[EventRecord])
+
+# Joins an event's lowercase search fields into one haystack; never appears in the data,
+# so a match can't span two fields.
+_SEARCH_FIELD_SEPARATOR = "\x1f"
+
+_WORD_SPLIT = re.compile(r"[^a-z0-9]+")
+
+
 class EventStore:
     """
     Loads event metadata and supports filtering by date, day of week, time, or keywords.
@@ -39,6 +47,13 @@ class EventStore:
         self.data_dir = Path(data_dir)
         self._events: Dict[str, EventRecord] = {}
         self._order: List[str] = []
+        self._search_haystacks: List[str] = []
+        # JSON-safe dumps for tool responses, built once per load.
+        self._json_payloads: Dict[str, Dict[str, Any]] = {}
+        # Secondary indexes for the exact-match filters; each bucket keeps list order.
+        self._by_date: Dict[date, List[EventRecord]] = {}
+        self._by_day_of_week: Dict[str, List[EventRecord]] = {}
+        self._by_time: Dict[time, List[EventRecord]] = {}
         self.reload()
 
     @property
@@ -50,24 +65,40 @@ class EventStore:
         if not self.events_path.exists():
             raise FileNotFoundError(f"Missing events metadata file: {self.events_path}")
 
-        with self.events_path.open("r", encoding="utf-8") as file:
-            raw = json.load(file)
-
-        if not isinstance(raw, list):
-            raise ValueError("events.json must contain a list of event entries.")
+        try:
+            records = _EVENT_LIST_ADAPTER.validate_json(self.events_path.read_bytes())
+        except ValidationError as exc:
+            error = exc.errors()[0]
+            loc = error["loc"]
+            if loc and isinstance(loc[0], int):
+                raise ValueError(f"Invalid event metadata at index {loc[0]}: {exc}") from exc
+            if error["type"] == "list_type":
+                raise ValueError("events.json must contain a list of event entries.") from exc
+            raise ValueError(f"events.json is not valid JSON: {exc}") from exc
 
         events: Dict[str, EventRecord] = {}
         order: List[str] = []
-        for idx, entry in enumerate(raw):
-            try:
-                record = EventRecord.model_validate(entry)
-            except ValidationError as exc:
-                raise ValueError(f"Invalid event metadata at index {idx}: {exc}") from exc
+        search_haystacks: List[str] = []
+        json_payloads: Dict[str, Dict[str, Any]] = {}
+        by_date: Dict[date, List[EventRecord]] = {}
+        by_day_of_week: Dict[str, List[EventRecord]] = {}
+        by_time: Dict[time, List[EventRecord]] = {}
+        for record in records:
             events[record.id] = record
             order.append(record.id)
+            search_haystacks.append(self._search_haystack(record))
+            json_payloads[record.id] = record.model_dump(mode="json", by_alias=True)
+            by_date.setdefault(record.date, []).append(record)
+            by_day_of_week.setdefault(record.day_of_week.strip().lower(), []).append(record)
+            by_time.setdefault(record.time, []).append(record)
 
         self._events = events
         self._order = order
+        self._search_haystacks = search_haystacks
+        self._json_payloads = json_payloads
+        self._by_date = by_date
+        self._by_day_of_week = by_day_of_week
+        self._by_time = by_time
 
     def list_events(self) -> List[EventRecord]:
         """Return all events in list order."""
@@ -76,55 +107,49 @@ class EventStore:
     def get_event(self, event_id: str) -> EventRecord | None:
         return self._events.get(event_id)
 
+    def get_events(self, event_ids: Iterable[str]) -> List[EventRecord]:
+        """Return events in request order, skipping unknown ids."""
+        return [record for event_id in event_ids if (record := self._events.get(event_id))]
+
+    def dump_events(self, events: Iterable[EventRecord]) -> List[Dict[str, Any]]:
+        """Return JSON-safe dicts for events, copied from the dumps built on load."""
+        payloads: List[Dict[str, Any]] = []
+        for record in events:
+            if self._events.get(record.id) is record:
+                payloads.append(dict(self._json_payloads[record.id]))
+            else:
+                payloads.append(record.model_dump(mode="json", by_alias=True))
+        return payloads
+
     def search_by_date(self, value: str | date | datetime) -> List[EventRecord]:
         target = self._parse_date(value)
         if not target:
             return []
-        return [
-            record for event_id in self._order if (record := self._events[event_id]).date == target
-        ]
+        return list(self._by_date.get(target, ()))
 
     def search_by_day_of_week(self, day: str) -> List[EventRecord]:
         normalized = day.strip().lower()
         if not normalized:
             return []
-        return [
-            record
-            for event_id in self._order
-            if (record := self._events[event_id]).day_of_week.strip().lower() == normalized
-        ]
+        return list(self._by_day_of_week.get(normalized, ()))
 
     def search_by_time(self, value: str | time | datetime) -> List[EventRecord]:
         target = self._parse_time(value)
         if not target:
             return []
-        return [
-            record for event_id in self._order if (record := self._events[event_id]).time == target
-        ]
+        return list(self._by_time.get(target, ()))
 
     def search_by_keyword(self, terms: str | Sequence[str]) -> List[EventRecord]:
-        normalized_terms = self._normalize_keywords(terms)
+        normalized_terms = [
+            term for term in self._normalize_keywords(terms) if _SEARCH_FIELD_SEPARATOR not in term
+        ]
         if not normalized_terms:
             return []
 
-        def _fields(record: EventRecord) -> List[str]:
-            combined_keywords = " ".join(record.keywords)
-            return [
-                record.id,
-                record.day_of_week,
-                record.location,
-                record.title,
-                record.details,
-                record.category,
-                combined_keywords,
-            ]
-
         matches: List[EventRecord] = []
-        for event_id in self._order:
-            record = self._events[event_id]
-            haystack = [field.lower() for field in _fields(record)]
-            if any(term in field for term in normalized_terms for field in haystack):
-                matches.append(record)
+        for event_id, haystack in zip(self._order, self._search_haystacks):
+            if any(term in haystack for term in normalized_terms):
+                matches.append(self._events[event_id])
 
         return matches
 
@@ -143,6 +168,19 @@ class EventStore:
         return sorted(keywords.keys())
 
     # -- Helpers ---------------------------------------------------------
+    def _search_haystack(self, record: EventRecord) -> str:
+        """Lowercase searchable fields joined into a single string for keyword matching."""
+        fields = [
+            record.id,
+            record.day_of_week,
+            record.location,
+            record.title,
+            record.details,
+            record.category,
+            " ".join(record.keywords),
+        ]
+        return _SEARCH_FIELD_SEPARATOR.join(field.lower() for field in fields)
+
     def _parse_date(self, value: str | date | datetime) -> date | None:
         if isinstance(value, datetime):
             return value.date()
@@ -181,9 +219,14 @@ class EventStore:
         else:
             values = terms
         normalized: List[str] = []
+        seen: set[str] = set()
         for value in values:
             text = value.strip().lower()
-            if text:
-                normalized.append(text)
-                normalized.extend(token for token in re.split(r"[^a-z0-9]+", text) if token)
-        return list(dict.fromkeys(normalized))  # dedupe while preserving order
+            if not text:
+                continue
+            # Dedupe while preserving order: the full phrase first, then its word tokens.
+            for term in (text, *_WORD_SPLIT.split(text)):
+                if term and term not in seen:
+                    seen.add(term)
+                    normalized.append(term)
+        return normalized
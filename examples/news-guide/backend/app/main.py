@@ -4,9 +4,10 @@ from __future__ import annotations
 
 from typing import Any
 
+import orjson
 from chatkit.server import StreamingResult
-from fastapi import Depends, FastAPI, HTTPException, Request, status
-from fastapi.responses import Response, StreamingResponse
+from fastapi import FastAPI, HTTPException, Request, status
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from starlette.responses import JSONResponse
 
 from .data.article_store import ArticleMetadata
@@ -14,7 +15,7 @@ from .request_context import RequestContext
 from .server import NewsAssistantServer, create_chatkit_server
 from .widgets.preview_widgets import build_article_preview_widget, build_author_preview_widget
 
-app = FastAPI(title="ChatKit API")
+app = FastAPI(title="ChatKit API", default_response_class=ORJSONResponse)
 
 _chatkit_server: NewsAssistantServer | None = create_chatkit_server()
 
@@ -32,9 +33,8 @@ def get_chatkit_server() -> NewsAssistantServer:
 
 
 @app.post("/chatkit")
-async def chatkit_endpoint(
-    request: Request, server: NewsAssistantServer = Depends(get_chatkit_server)
-) -> Response:
+async def chatkit_endpoint(request: Request) -> Response:
+    server = get_chatkit_server()
     payload = await request.body()
     article_id = request.headers.get("article-id")
     context = RequestContext(request=request, article_id=article_id)
@@ -46,32 +46,35 @@ async def chatkit_endpoint(
     return JSONResponse(result)
 
 
-FEATURED_ARTICLE_IDS = [
+FEATURED_ARTICLE_IDS = (
     "unscheduled-parade-formation",
     "community-fridge-apple-pies",
     "missed-connection-reunion",
     "transit-pass-machine-updated",
-]
+)
 
 
 @app.get("/articles/featured")
-async def list_featured_articles(
-    server: NewsAssistantServer = Depends(get_chatkit_server),
-) -> dict[str, Any]:
-    return {
-        "articles": [
-            server.article_store.get_metadata(article_id) for article_id in FEATURED_ARTICLE_IDS
-        ]
-    }
+async def list_featured_articles() -> dict[str, Any]:
+    server = get_chatkit_server()
+    return {"articles": server.article_store.get_metadata_many(FEATURED_ARTICLE_IDS)}
+
+
+# Encoded /articles/tags body, keyed by the article store generation it was built from.
+_tags_cache: tuple[int, bytes] | None = None
 
 
 # Because this is a demo with a small number of articles and authors,
 # we are returning all tags and authors in a single request to power
 # entity tag search and preview requests within the client.
 @app.get("/articles/tags")
-async def list_article_tags(
-    server: NewsAssistantServer = Depends(get_chatkit_server),
-) -> dict[str, Any]:
+async def list_article_tags() -> Response:
+    global _tags_cache
+    server = get_chatkit_server()
+    generation = server.article_store.generation
+    if _tags_cache is not None and _tags_cache[0] == generation:
+        return Response(content=_tags_cache[1], media_type="application/json")
+
     def _truncate_title(value: str, max_length: int = 30) -> str:
         if len(value) <= max_length:
             return value
@@ -124,14 +127,14 @@ async def list_article_tags(
     articles = [_build_article_tag(entry) for entry in server.article_store.list_metadata()]
     authors = [_build_author_tag(entry) for entry in server.article_store.list_authors()]
 
-    return {"tags": articles + authors}
+    content = orjson.dumps({"tags": articles + authors})
+    _tags_cache = (generation, content)
+    return Response(content=content, media_type="application/json")
 
 
 @app.get("/articles/{article_id}")
-async def read_article(
-    article_id: str,
-    server: NewsAssistantServer = Depends(get_chatkit_server),
-) -> dict[str, Any]:
+async def read_article(article_id: str) -> dict[str, Any]:
+    server = get_chatkit_server()
     article = server.article_store.get_article(article_id)
     if not article:
         raise HTTPException(
@@ -5,9 +5,10 @@ NewsAssistantServer implements the ChatKitServer interface for the News Guide de
 from __future__ import annotations
 
 import asyncio
+import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Any, AsyncIterator
+from typing import Any, AsyncIterator, Callable
 
 from agents import Agent, Runner
 from chatkit.agents import stream_agent_response
@@ -32,12 +33,17 @@ from .agents.news_agent import NewsAgentContext, news_agent
 from .agents.puzzle_agent import PuzzleAgentContext, puzzle_agent
 from .agents.title_agent import title_agent
 from .data.article_store import ArticleStore
-from .data.event_store import EventRecord, EventStore
+from .data.event_store import EventStore
 from .memory_store import MemoryStore
 from .request_context import RequestContext
 from .thread_item_converter import NewsGuideThreadItemConverter
 from .widgets.event_list_widget import build_event_list_widget
 
+logger = logging.getLogger(__name__)
+
+AgentSelection = tuple[Agent, NewsAgentContext | EventFinderContext | PuzzleAgentContext]
+AgentBuilder = Callable[[ThreadMetadata, RequestContext], AgentSelection]
+
 
 class NewsAssistantServer(ChatKitServer[RequestContext]):
     """ChatKit server wired up with the News Guide editorial assistant."""
@@ -51,6 +57,11 @@ class NewsAssistantServer(ChatKitServer[RequestContext]):
         self.event_store = EventStore(data_dir)
         self.thread_item_converter = NewsGuideThreadItemConverter()
         self.title_agent = title_agent
+        # tool_choice id -> agent/context builder; anything else goes to the news agent.
+        self._agent_builders: dict[str, AgentBuilder] = {
+            "event_finder": self._event_finder_agent,
+            "puzzle": self._puzzle_agent,
+        }
 
     # -- Required overrides ----------------------------------------------------
     async def respond(
@@ -67,7 +78,7 @@ class NewsAssistantServer(ChatKitServer[RequestContext]):
             order="desc",
             context=context,
         )
-        items = list(reversed(items_page.data))
+        items = items_page.data[::-1]
         input_items = await self.thread_item_converter.to_agent_input(items)
 
         agent, agent_context = self._select_agent(thread, item, context)
@@ -76,7 +87,11 @@ class NewsAssistantServer(ChatKitServer[RequestContext]):
 
         async for event in stream_agent_response(agent_context, result):
             yield event
-        await updating_thread_title
+        # The title runs alongside the response; a failed title shouldn't fail the turn.
+        try:
+            await updating_thread_title
+        except Exception:
+            logger.exception("Failed to update thread title for %s", thread.id)
         return
 
     async def action(
@@ -159,14 +174,8 @@ class NewsAssistantServer(ChatKitServer[RequestContext]):
         if is_selected or not record or not event_ids or not sender:
             return
 
-        records: list[EventRecord] = []
-        for event_id in event_ids:
-            record = self.event_store.get_event(event_id)
-            if record:
-                records.append(record)
-
         updated_widget = build_event_list_widget(
-            records,
+            self.event_store.get_events(event_ids),
             selected_event_id=selected_event_id,
         )
 
@@ -183,27 +192,30 @@ class NewsAssistantServer(ChatKitServer[RequestContext]):
         thread: ThreadMetadata,
         item: UserMessageItem | None,
         context: RequestContext,
-    ) -> tuple[
-        Agent,
-        NewsAgentContext | EventFinderContext | PuzzleAgentContext,
-    ]:
-        tool_choice = self._resolve_tool_choice(item)
-        if tool_choice == "event_finder":
-            event_context = EventFinderContext(
-                thread=thread,
-                store=self.store,
-                events=self.event_store,
-                request_context=context,
-            )
-            return event_finder_agent, event_context
-        if tool_choice == "puzzle":
-            puzzle_context = PuzzleAgentContext(
-                thread=thread,
-                store=self.store,
-                request_context=context,
-            )
-            return puzzle_agent, puzzle_context
+    ) -> AgentSelection:
+        build = self._agent_builders.get(self._resolve_tool_choice(item) or "", self._news_agent)
+        return build(thread, context)
+
+    def _event_finder_agent(
+        self, thread: ThreadMetadata, context: RequestContext
+    ) -> AgentSelection:
+        event_context = EventFinderContext(
+            thread=thread,
+            store=self.store,
+            events=self.event_store,
+            request_context=context,
+        )
+        return event_finder_agent, event_context
+
+    def _puzzle_agent(self, thread: ThreadMetadata, context: RequestContext) -> AgentSelection:
+        puzzle_context = PuzzleAgentContext(
+            thread=thread,
+            store=self.store,
+            request_context=context,
+        )
+        return puzzle_agent, puzzle_context
 
+    def _news_agent(self, thread: ThreadMetadata, context: RequestContext) -> AgentSelection:
         news_context = NewsAgentContext(
             thread=thread,
             store=self.store,
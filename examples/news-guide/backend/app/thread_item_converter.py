@@ -2,44 +2,74 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
+
+from agents import TResponseInputItem
 from chatkit.agents import ThreadItemConverter
-from chatkit.types import HiddenContextItem, UserMessageTagContent
+from chatkit.types import AssistantMessageItem, HiddenContextItem, UserMessageTagContent
 from openai.types.responses import ResponseInputTextParam
 from openai.types.responses.response_input_item_param import Message
 
+_format_author_reference = "Tagged author: {name}\n<AUTHOR_REFERENCE>{id}</AUTHOR_REFERENCE>".format
+_format_article_reference = (
+    "Tagged article: {title}\n<ARTICLE_REFERENCE>{id}</ARTICLE_REFERENCE>".format
+)
+
+# Converted assistant messages kept across turns; history is reloaded on every respond().
+_ASSISTANT_CACHE_SIZE = 1024
+
 
 class NewsGuideThreadItemConverter(ThreadItemConverter):
     """Adds support for hidden context and @-mention tags."""
 
-    async def hidden_context_to_input(self, item: HiddenContextItem):
-        return Message(
-            type="message",
-            content=[
-                ResponseInputTextParam(
-                    type="input_text",
-                    text=item.content,
-                )
-            ],
-            role="user",
-        )
+    def __init__(self) -> None:
+        # item id -> (item, converted input); the identity check skips entries for items
+        # the store has since replaced.
+        self._assistant_inputs: OrderedDict[
+            str, tuple[AssistantMessageItem, TResponseInputItem | list[TResponseInputItem] | None]
+        ] = OrderedDict()
+
+    async def assistant_message_to_input(
+        self, item: AssistantMessageItem
+    ) -> TResponseInputItem | list[TResponseInputItem] | None:
+        """
+        Reuse the conversion of stored assistant messages. Streaming updates copy the item
+        rather than mutating it, so a stored instance always converts to the same input.
+        """
+        cached = self._assistant_inputs.get(item.id)
+        if cached is not None and cached[0] is item:
+            self._assistant_inputs.move_to_end(item.id)
+            return cached[1]
+
+        converted = await super().assistant_message_to_input(item)
+        self._assistant_inputs[item.id] = (item, converted)
+        if len(self._assistant_inputs) > _ASSISTANT_CACHE_SIZE:
+            self._assistant_inputs.popitem(last=False)
+        return converted
+
+    async def hidden_context_to_input(self, item: HiddenContextItem) -> Message:
+        return {
+            "type": "message",
+            "content": [{"type": "input_text", "text": item.content}],
+            "role": "user",
+        }
 
     async def tag_to_message_content(self, tag: UserMessageTagContent) -> ResponseInputTextParam:
         """
         Represent a tagged article in the model input so the agent can load it by id.
         """
-        tag_data = tag.data or {}
-        tag_type = tag_data.get("type")
-
-        if tag_type == "author":
-            author_name = (tag_data.get("author") or tag.text).strip()
-            author_id = (tag_data.get("author_id") or tag.id or "").strip()
-            marker = f"<AUTHOR_REFERENCE>{author_id}</AUTHOR_REFERENCE>"
-            text = f"Tagged author: {author_name}\n{marker}"
+        get = (tag.data or {}).get
+
+        if get("type") == "author":
+            text = _format_author_reference(
+                name=(get("author") or tag.text).strip(),
+                id=(get("author_id") or tag.id or "").strip(),
+            )
         else:
-            display_title = tag_data.get("title") or tag.text
-            article_id = (tag_data.get("article_id") or tag.id or "").strip()
-            marker = f"<ARTICLE_REFERENCE>{article_id}</ARTICLE_REFERENCE>"
-            text = f"Tagged article: {display_title}\n{marker}"
+            text = _format_article_reference(
+                title=get("title") or tag.text,
+                id=(get("article_id") or tag.id or "").strip(),
+            )
         return ResponseInputTextParam(
             type="input_text",
             text=text,
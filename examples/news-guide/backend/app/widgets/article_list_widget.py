@@ -5,26 +5,34 @@ same layout cues as the featured article card in the Newsroom panel.
 
 from __future__ import annotations
 
-from datetime import datetime
+from functools import cache
 from typing import Any
 
-from chatkit.widgets import WidgetRoot, WidgetTemplate
+from chatkit.widgets import WidgetRoot
 
 from ..data.article_store import ArticleMetadata
+from .formatting import format_article_date
+from .widget_template import WidgetTemplate
 
 
-def _format_date(value: datetime) -> str:
-    month = value.strftime("%b")
-    return f"{month} {value.day}, {value.year}"
+@cache
+def _article_list_widget_template() -> WidgetTemplate:
+    """Load and compile article_list.widget on first use rather than at import."""
+    return WidgetTemplate.from_file("article_list.widget")
 
 
-article_list_widget_template = WidgetTemplate.from_file("article_list.widget")
-
-
-def build_article_list_widget(articles: list[ArticleMetadata]) -> WidgetRoot:
-    """Render an article list widget using the .widget template."""
-    payload = {"articles": [_serialize_article(article) for article in articles]}
-    return article_list_widget_template.build(payload)
+def build_article_list_widget(articles: list[ArticleMetadata]) -> tuple[WidgetRoot, str]:
+    """
+    Render an article list widget using the .widget template.
+    Returns the widget along with its copy text, collected in the same pass over the articles.
+    """
+    serialized: list[dict[str, Any]] = []
+    titles: list[str] = []
+    for article in articles:
+        serialized.append(_serialize_article(article))
+        titles.append(article.title)
+    widget = _article_list_widget_template().build({"articles": serialized})
+    return widget, ", ".join(titles)
 
 
 def _serialize_article(article: ArticleMetadata) -> dict[str, Any]:
@@ -33,5 +41,5 @@ def _serialize_article(article: ArticleMetadata) -> dict[str, Any]:
         "title": article.title,
         "author": article.author,
         "heroImageUrl": article.heroImageUrl,
-        "date": _format_date(article.date),
+        "date": format_article_date(article.date),
     }
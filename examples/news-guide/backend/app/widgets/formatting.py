@@ -0,0 +1,48 @@
+"""
+Date and time labels shared by the widget builders.
+Cached because listings repeat the same dates. Names come from fixed English tables rather
+than strftime, which is slower and would follow the process locale.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time
+from functools import lru_cache
+
+_MONTH_ABBREVIATIONS = (
+    "",
+    "Jan",
+    "Feb",
+    "Mar",
+    "Apr",
+    "May",
+    "Jun",
+    "Jul",
+    "Aug",
+    "Sep",
+    "Oct",
+    "Nov",
+    "Dec",
+)
+_WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+
+@lru_cache(maxsize=4096)
+def format_article_date(value: datetime) -> str:
+    """Format a publication date as `Mar 4, 2025`."""
+    return f"{_MONTH_ABBREVIATIONS[value.month]} {value.day}, {value.year}"
+
+
+@lru_cache(maxsize=4096)
+def format_event_date(event_date: date) -> str:
+    """Format an event date as `Tuesday, Mar 4`."""
+    weekday = _WEEKDAYS[event_date.weekday()]
+    return f"{weekday}, {_MONTH_ABBREVIATIONS[event_date.month]} {event_date.day}"
+
+
+@lru_cache(maxsize=4096)
+def format_event_time(event_time: time) -> str:
+    """Format an event start time as `6:30 PM`."""
+    hour = event_time.hour
+    meridiem = "AM" if hour < 12 else "PM"
+    return f"{hour % 12 or 12}:{event_time.minute:02d} {meridiem}"
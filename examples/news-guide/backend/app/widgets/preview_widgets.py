@@ -1,8 +1,10 @@
+from functools import cache, lru_cache
 from typing import Any
 
-from chatkit.widgets import BasicRoot, WidgetTemplate
+from chatkit.widgets import BasicRoot
 
 from ..data.article_store import ArticleMetadata
+from .widget_template import WidgetTemplate
 
 AUTHOR_PROFILES: dict[str, dict[str, str]] = {
     "elowen-wilder": {
@@ -44,8 +46,17 @@ DEFAULT_PROFILE = {
     "bio": "Foxhollow Dispatch contributor.",
 }
 
-article_preview_widget_template = WidgetTemplate.from_file("article_preview.widget")
-author_preview_widget_template = WidgetTemplate.from_file("author_preview.widget")
+
+@cache
+def _article_preview_widget_template() -> WidgetTemplate:
+    """Load and compile article_preview.widget on first use rather than at import."""
+    return WidgetTemplate.from_file("article_preview.widget")
+
+
+@cache
+def _author_preview_widget_template() -> WidgetTemplate:
+    """Load and compile author_preview.widget on first use rather than at import."""
+    return WidgetTemplate.from_file("author_preview.widget")
 
 
 def build_article_preview_widget(article: ArticleMetadata) -> BasicRoot:
@@ -56,11 +67,7 @@ def build_article_preview_widget(article: ArticleMetadata) -> BasicRoot:
         "heroImageUrl": article.heroImageUrl,
         "date": article.date.strftime("%b %d, %Y"),
     }
-    return article_preview_widget_template.build_basic(payload)
-
-
-def _profile_for_author(author_slug: str) -> dict[str, str]:
-    return AUTHOR_PROFILES.get(author_slug, DEFAULT_PROFILE)
+    return _article_preview_widget_template().build_basic(payload)
 
 
 def build_author_preview_widget(
@@ -68,7 +75,17 @@ def build_author_preview_widget(
     author_slug: str,
     article_count: int,
 ) -> BasicRoot:
-    profile = _profile_for_author(author_slug)
+    # BasicRoot keeps extra fields (such as `border`) by reference, so each widget gets its
+    # own copy of the cached dict.
+    return BasicRoot.model_validate(
+        _copy_json(_render_author_preview(author_name, author_slug, article_count))
+    )
+
+
+@lru_cache(maxsize=256)
+def _render_author_preview(author_name: str, author_slug: str, article_count: int) -> Any:
+    # Authors and their archive counts barely change, so the Jinja render is reused.
+    profile = AUTHOR_PROFILES.get(author_slug, DEFAULT_PROFILE)
     payload: dict[str, Any] = {
         "slug": author_slug,
         "name": author_name,
@@ -76,4 +93,13 @@ def build_author_preview_widget(
         "bio": profile["bio"],
         "articleCount": article_count,
     }
-    return author_preview_widget_template.build_basic(payload)
+    return _author_preview_widget_template().render(payload)
+
+
+def _copy_json(value: Any) -> Any:
+    """Copy the dicts and lists of parsed JSON; cheaper than `copy.deepcopy` for plain data."""
+    if isinstance(value, dict):
+        return {key: _copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(item) for item in value]
+    return value
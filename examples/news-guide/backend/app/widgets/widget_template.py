@@ -0,0 +1,230 @@
+"""
+WidgetTemplate variant that compiles `.widget` templates through a shared Jinja
+environment with a bytecode cache, and renders templates made only of placeholders
+and comma-joined list loops through a direct substitution path.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Any, NamedTuple, Sequence
+
+import orjson
+from chatkit.widgets import BasicRoot, DynamicWidgetRoot
+from chatkit.widgets import WidgetTemplate as BaseWidgetTemplate
+from jinja2 import DictLoader, Environment, FileSystemBytecodeCache, StrictUndefined, Template
+from pydantic import BaseModel
+
+# Template sources keyed by SHA1, so identical sources share one compiled template and the
+# on-disk bytecode cache can skip Jinja's lexer/parser on later process starts.
+_template_sources: dict[str, str] = {}
+
+# Loaded templates keyed by class and absolute path; see WidgetTemplate.from_file.
+_loaded_templates: dict[tuple[type[WidgetTemplate], str], WidgetTemplate] = {}
+
+env = Environment(
+    undefined=StrictUndefined,
+    loader=DictLoader(_template_sources),
+    bytecode_cache=FileSystemBytecodeCache(),
+)
+
+_PLACEHOLDER = re.compile(r"\{\{(.*?)\}\}", re.DOTALL)
+_TOJSON_EXPRESSION = re.compile(r"^\s*\((.*)\)\s*\|\s*tojson\s*$", re.DOTALL)
+_OPERAND = re.compile(r"\s*(?:\"([^\"\\]*)\"|'([^'\\]*)'|([A-Za-z_]\w*(?:\.[A-Za-z_]\w*)*))\s*")
+# The comma-joined list idiom emitted by the widget builder for repeated children:
+# `{%- set _c -%}{%-for item in items -%},<item>{%-endfor-%}{%- endset -%}{{- (_c[1:] ...) -}}`
+_LIST_LOOP = re.compile(
+    r"\{%-\s*set\s+(\w+)\s*-%\}"
+    r"\{%-\s*for\s+(\w+)\s+in\s+(\w+)\s*-%\}\s*,(.*?)\{%-\s*endfor\s*-%\}"
+    r"\{%-\s*endset\s*-%\}"
+    r"\{\{-\s*\(\s*\1\[1:\]\s+if\s+\1\s+and\s+\1\[0\]\s*==\s*','\s+else\s+\1\s*\)\s*-\}\}",
+    re.DOTALL,
+)
+
+# A placeholder is a `~`-joined sequence of operands: literal strings, or variables as
+# dotted lookup paths.
+Placeholder = tuple[str | tuple[str, ...], ...]
+
+
+class ListLoop(NamedTuple):
+    """A `for` loop rendering each item of `iterable` as a comma-separated JSON chunk."""
+
+    variable: str
+    iterable: str
+    parts: Sequence[str | Placeholder]
+
+
+TemplatePart = str | Placeholder | ListLoop
+
+
+def compile_template(source: str) -> Template:
+    """Return the compiled Jinja template for a widget template source string."""
+    key = hashlib.sha1(source.encode("utf-8")).hexdigest()
+    _template_sources.setdefault(key, source)
+    return env.get_template(key)
+
+
+def _parse_placeholder(expression: str) -> Placeholder | None:
+    """
+    Parse `(name) | tojson` or `(("literal" ~ name)) | tojson` style expressions.
+    Returns None for anything else so the template is rendered with Jinja.
+    """
+    match = _TOJSON_EXPRESSION.match(expression)
+    if not match:
+        return None
+    inner = match.group(1).strip()
+    while inner.startswith("(") and inner.endswith(")"):
+        inner = inner[1:-1].strip()
+
+    operands: list[str | tuple[str, ...]] = []
+    for part in inner.split("~"):
+        operand = _OPERAND.fullmatch(part)
+        if not operand:
+            return None
+        double_quoted, single_quoted, name = operand.groups()
+        if name is not None:
+            path = tuple(name.split("."))
+            # Jinja resolves `a.b` as an attribute before an item, so names shadowed by
+            # dict attributes (`a.items`, `a.keys`, ...) need the real renderer.
+            if any(hasattr(dict, attribute) for attribute in path[1:]):
+                return None
+            operands.append(path)
+        else:
+            operands.append(double_quoted if double_quoted is not None else single_quoted)
+    return tuple(operands)
+
+
+def _split_placeholders(source: str) -> list[str | Placeholder] | None:
+    """
+    Split a template chunk without control flow into literal chunks and placeholders.
+    Returns None when the chunk needs the full Jinja renderer.
+    """
+    if "{%" in source or "{#" in source:
+        return None
+
+    parts: list[str | Placeholder] = []
+    position = 0
+    for match in _PLACEHOLDER.finditer(source):
+        placeholder = _parse_placeholder(match.group(1))
+        if placeholder is None:
+            return None
+        parts.append(source[position : match.start()])
+        parts.append(placeholder)
+        position = match.end()
+    parts.append(source[position:])
+    return parts
+
+
+def _split_simple_template(source: str) -> list[TemplatePart] | None:
+    """
+    Split a template into literal chunks, placeholders and comma-joined list loops.
+    Returns None when the template needs the full Jinja renderer.
+    """
+    parts: list[TemplatePart] = []
+    position = 0
+    for match in _LIST_LOOP.finditer(source):
+        # The `{%-`/`-%}`/`-}}` markers around the loop strip adjacent whitespace.
+        chunk = source[position : match.start()].rstrip()
+        before = _split_placeholders(chunk.lstrip() if position else chunk)
+        body = _split_placeholders(match.group(4).rstrip())
+        if before is None or body is None:
+            return None
+        parts.extend(before)
+        parts.append(ListLoop(variable=match.group(2), iterable=match.group(3), parts=body))
+        position = match.end()
+    rest = source[position:]
+    tail_parts = _split_placeholders(rest.lstrip() if position else rest)
+    if tail_parts is None:
+        return None
+    parts.extend(tail_parts)
+    return parts
+
+
+def _lookup(values: dict[str, Any], path: tuple[str, ...]) -> Any:
+    value = values[path[0]]
+    for key in path[1:]:
+        if not isinstance(value, dict):
+            raise TypeError(f"Cannot look up {key!r} on {type(value).__name__}")
+        value = value[key]
+    return value
+
+
+def _render_parts(parts: Sequence[TemplatePart], values: dict[str, Any]) -> str:
+    """Render parsed template parts; raises KeyError/TypeError when Jinja should take over."""
+    chunks: list[str] = []
+    for part in parts:
+        if isinstance(part, str):
+            chunks.append(part)
+        elif isinstance(part, ListLoop):
+            items = values[part.iterable]
+            if not isinstance(items, (list, tuple)):
+                raise TypeError(f"Cannot iterate {type(items).__name__} directly")
+            chunks.append(
+                ",".join(
+                    _render_parts(part.parts, {**values, part.variable: item}) for item in items
+                )
+            )
+        else:
+            if len(part) == 1 and isinstance(part[0], tuple):
+                value = _lookup(values, part[0])
+            else:
+                value = "".join(
+                    str(_lookup(values, operand)) if isinstance(operand, tuple) else operand
+                    for operand in part
+                )
+            chunks.append(json.dumps(value, sort_keys=True))
+    return "".join(chunks)
+
+
+class WidgetTemplate(BaseWidgetTemplate):
+    """ChatKit WidgetTemplate that compiles string templates with the cached environment."""
+
+    def __init__(self, definition: dict[str, Any]):
+        template = definition["template"]
+        self._simple_parts: list[TemplatePart] | None = None
+        if isinstance(template, str):
+            self._simple_parts = _split_simple_template(template)
+            definition = {**definition, "template": compile_template(template)}
+        super().__init__(definition)
+
+    @classmethod
+    def from_file(cls, file_path: str) -> WidgetTemplate:
+        """
+        Load a `.widget` file, resolving relative paths against the calling module.
+        Templates are cached per class and absolute path, so repeated loads are free.
+        """
+        path = Path(file_path)
+        if not path.is_absolute():
+            # The caller's frame is enough here; `inspect.stack()` walks the whole stack.
+            caller_path = Path(sys._getframe(1).f_code.co_filename).resolve()
+            path = caller_path.parent / path
+        key = (cls, str(path))
+        template = _loaded_templates.get(key)
+        if template is None:
+            template = cls(orjson.loads(path.read_bytes()))
+            _loaded_templates[key] = template
+        return template
+
+    def build(self, data: dict[str, Any] | BaseModel | None = None) -> DynamicWidgetRoot:
+        return DynamicWidgetRoot.model_validate(self.render(data))
+
+    def build_basic(self, data: dict[str, Any] | BaseModel | None = None) -> BasicRoot:
+        return BasicRoot.model_validate(self.render(data))
+
+    def render(self, data: dict[str, Any] | BaseModel | None = None) -> Any:
+        """
+        Render the template to a widget dict, parsing the JSON output with orjson. Templates
+        made only of placeholders and list loops are substituted directly, bypassing Jinja;
+        missing data falls back to Jinja so it reports the error.
+        """
+        values = self._normalize_data(data)
+        if self._simple_parts is not None:
+            try:
+                return orjson.loads(_render_parts(self._simple_parts, values))
+            except (KeyError, TypeError):
+                pass
+        return orjson.loads(self.template.render(**values))